@@ -5,6 +5,8 @@ import shutil
 import sqlite3
 import subprocess
 import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from hashlib import pbkdf2_hmac
 from pathlib import Path
@@ -12,7 +14,7 @@ from pathlib import Path
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 
-from .models import BrowserProfile, Cookie
+from .models import BrowserProfile, Cookie, CookieSummary, DomainStats, as_utc
 
 # Chrome uses microseconds since Jan 1, 1601 (Windows epoch)
 CHROME_EPOCH = datetime(1601, 1, 1, tzinfo=timezone.utc)
@@ -24,6 +26,22 @@ SAME_SITE_MAP: dict[int, str | None] = {
     2: "strict",
 }
 
+# Rows are fetched in batches of at most this many cookies...
+DEFAULT_BATCH_SIZE = 500
+# ...and batches are made smaller if needed to hold at most this many bytes
+# of row data.
+DEFAULT_MAX_BATCH_BYTES = 4 * 1024 * 1024
+
+# SQL expression for the bytes of text and blob data in a cookie row
+ROW_BYTES_SQL = (
+    "length(CAST(host_key AS BLOB)) + length(CAST(name AS BLOB))"
+    " + length(encrypted_value) + length(CAST(path AS BLOB))"
+)
+
+# SQL predicate for cookies that have expired; session cookies have
+# expires_utc = 0 and never expire. Takes the reference time as parameter.
+EXPIRED_SQL = "expires_utc != 0 AND expires_utc < ?"
+
 CHROME_BASE_PATH = Path.home() / "Library/Application Support/Google/Chrome"
 
 
@@ -58,7 +76,27 @@ def _get_cookie_path(profile: str = "Default") -> Path:
     return CHROME_BASE_PATH / profile / "Cookies"
 
 
-def _get_encryption_key() -> bytes:
+@contextmanager
+def _open_database(cookie_path: Path) -> Iterator[sqlite3.Connection]:
+    """Opens a temporary copy of a cookie database.
+
+    The database is copied to avoid locking issues while Chrome is running.
+    """
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as tmp:
+        tmp_path = Path(tmp.name)
+
+    try:
+        shutil.copy2(cookie_path, tmp_path)
+        conn = sqlite3.connect(tmp_path)
+        try:
+            yield conn
+        finally:
+            conn.close()
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def get_encryption_key() -> bytes:
     """Retrieves Chrome's encryption key from macOS Keychain."""
     result = subprocess.run(
         [
@@ -131,93 +169,248 @@ def _chrome_time_to_datetime(chrome_time: int) -> datetime | None:
     if chrome_time == 0:
         return None
     try:
-        seconds = chrome_time / 1_000_000
-        return CHROME_EPOCH + timedelta(seconds=seconds)
+        return CHROME_EPOCH + timedelta(microseconds=chrome_time)
     except (ValueError, OverflowError):
         return None
 
 
-def get_cookies(
+def _datetime_to_chrome_time(dt: datetime) -> int:
+    """Converts a datetime to Chrome's timestamp (microseconds since 1601).
+
+    Naive datetimes are treated as UTC.
+    """
+    return (as_utc(dt) - CHROME_EPOCH) // timedelta(microseconds=1)
+
+
+def _batch_rows(batch_size: int, max_batch_bytes: int, max_row_bytes: int) -> int:
+    """
+    Returns how many rows to fetch per batch.
+
+    Sizing from the largest row keeps every batch within max_batch_bytes; a
+    single row larger than the cap is fetched on its own.
+    """
+    return max(1, min(batch_size, max_batch_bytes // max(max_row_bytes, 1)))
+
+
+def _fetch_batches(
+    cursor: sqlite3.Cursor, rows_per_batch: int
+) -> Iterator[list[tuple]]:
+    """Yields rows from an executed cursor, rows_per_batch at a time."""
+    while rows := cursor.fetchmany(rows_per_batch):
+        yield rows
+
+
+def _build_filters(
+    domain: str | None, expired: bool | None, now: datetime | None
+) -> tuple[str, tuple[int | str, ...]]:
+    """Builds the WHERE clause and parameters for the cookie filters."""
+    conditions: list[str] = []
+    params: tuple[int | str, ...] = ()
+
+    if domain:
+        conditions.append("host_key LIKE ?")
+        params += (f"%{domain}%",)
+
+    if expired is not None:
+        now = now or datetime.now(timezone.utc)
+        conditions.append(f"({EXPIRED_SQL})" if expired else f"NOT ({EXPIRED_SQL})")
+        params += (_datetime_to_chrome_time(now),)
+
+    if not conditions:
+        return "", params
+    return " WHERE " + " AND ".join(conditions), params
+
+
+def iter_cookies(
     domain: str | None = None,
     profile: str = "Default",
-) -> list[Cookie]:
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+    expired: bool | None = None,
+    now: datetime | None = None,
+    key: bytes | None = None,
+) -> Iterator[Cookie]:
     """
-    Reads cookies from Chrome's cookie database.
+    Streams cookies from Chrome's cookie database.
+
+    Rows are fetched in batches and each batch is decrypted as it arrives,
+    so memory use stays bounded regardless of how many cookies the profile
+    has. Batches hold at most batch_size rows, and fewer when needed to keep
+    them within max_batch_bytes of row data.
 
     Args:
         domain: If specified, only return cookies matching this domain.
                 Matches if the domain contains this string.
         profile: Chrome profile to read from (default: "Default").
-
-    Returns:
-        List of Cookie objects.
+        batch_size: Maximum number of rows fetched per batch.
+        max_batch_bytes: Maximum bytes of row data held per batch, unless a
+                         single row is larger.
+        expired: If True, only return expired cookies; if False, only
+                 return unexpired ones (including session cookies).
+        now: Reference time for the expired filter (default: current time).
+        key: Decryption key, to reuse one across profiles (default: fetched
+             from the Keychain).
+
+    Yields:
+        Cookie objects.
     """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    if max_batch_bytes < 1:
+        raise ValueError("max_batch_bytes must be at least 1")
+
     cookie_path = _get_cookie_path(profile)
 
     if not cookie_path.exists():
-        return []
+        return
 
-    key = _get_encryption_key()
+    if key is None:
+        key = get_encryption_key()
 
-    # Copy the database to avoid locking issues while Chrome is running
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as tmp:
-        tmp_path = Path(tmp.name)
-
-    try:
-        shutil.copy2(cookie_path, tmp_path)
-
-        conn = sqlite3.connect(tmp_path)
+    with _open_database(cookie_path) as conn:
         cursor = conn.cursor()
 
         # Check if we need to strip the hash prefix (Chrome 130+)
         db_version = _get_db_version(cursor)
         strip_hash = db_version >= 24
 
+        # Filters run in SQL so discarded rows are never decrypted or
+        # converted to datetimes
+        where, params = _build_filters(domain, expired, now)
+
+        cursor.execute(f"SELECT MAX({ROW_BYTES_SQL}) FROM cookies" + where, params)
+        max_row_bytes = cursor.fetchone()[0] or 0
+        rows_per_batch = _batch_rows(batch_size, max_batch_bytes, max_row_bytes)
+
         query = """
             SELECT host_key, name, encrypted_value, path,
                    expires_utc, is_secure, is_httponly, samesite
             FROM cookies
         """
-        params: tuple[str, ...] = ()
-
-        if domain:
-            query += " WHERE host_key LIKE ?"
-            params = (f"%{domain}%",)
-
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
-
-        cookies = []
-        for (
-            host_key,
-            name,
-            encrypted_value,
-            path,
-            expires_utc,
-            is_secure,
-            is_httponly,
-            samesite,
-        ) in rows:
-            try:
-                value = _decrypt_value(encrypted_value, key, strip_hash)
-                cookies.append(
-                    Cookie(
+        cursor.execute(query + where, params)
+
+        for rows in _fetch_batches(cursor, rows_per_batch):
+            for (
+                host_key,
+                name,
+                encrypted_value,
+                path,
+                expires_utc,
+                is_secure,
+                is_httponly,
+                samesite,
+            ) in rows:
+                try:
+                    value = _decrypt_value(encrypted_value, key, strip_hash)
+                    cookie = Cookie(
                         domain=host_key,
                         name=name,
                         value=value,
                         path=path,
+                        # Converted eagerly: Cookie.expires is a validated
+                        # datetime field. Only rows dropped by the SQL filters
+                        # skip the conversion.
                         expires=_chrome_time_to_datetime(expires_utc),
                         is_secure=bool(is_secure),
                         is_httponly=bool(is_httponly),
                         same_site=SAME_SITE_MAP.get(samesite, "unspecified"),
                     )
-                )
-            except Exception:
-                # Skip cookies that fail to decrypt
-                pass
+                except Exception:
+                    # Skip cookies that fail to decrypt
+                    continue
+                yield cookie
 
-        return cookies
 
-    finally:
-        tmp_path.unlink(missing_ok=True)
+def get_cookies(
+    domain: str | None = None,
+    profile: str = "Default",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+    expired: bool | None = None,
+    now: datetime | None = None,
+) -> list[Cookie]:
+    """
+    Reads cookies from Chrome's cookie database.
+
+    Args:
+        domain: If specified, only return cookies matching this domain.
+                Matches if the domain contains this string.
+        profile: Chrome profile to read from (default: "Default").
+        batch_size: Maximum number of rows fetched per batch.
+        max_batch_bytes: Maximum bytes of row data held per batch, unless a
+                         single row is larger.
+        expired: If True, only return expired cookies; if False, only
+                 return unexpired ones (including session cookies).
+        now: Reference time for the expired filter (default: current time).
+
+    Returns:
+        List of Cookie objects.
+    """
+    return list(
+        iter_cookies(
+            domain=domain,
+            profile=profile,
+            batch_size=batch_size,
+            max_batch_bytes=max_batch_bytes,
+            expired=expired,
+            now=now,
+        )
+    )
+
+
+def summarize(
+    domain: str | None = None,
+    profile: str = "Default",
+    now: datetime | None = None,
+) -> CookieSummary:
+    """
+    Summarizes Chrome's cookie database without decrypting any values.
+
+    Counts are computed with SQL aggregates, so neither the Keychain nor
+    the encrypted_value column is ever touched.
+
+    Args:
+        domain: If specified, only count cookies matching this domain.
+                Matches if the domain contains this string.
+        profile: Chrome profile to read from (default: "Default").
+        now: Reference time for counting expired cookies (default: current
+             time).
+
+    Returns:
+        CookieSummary with per-domain counts.
+    """
+    cookie_path = _get_cookie_path(profile)
+
+    if not cookie_path.exists():
+        return CookieSummary(browser="chrome", profile_name=profile)
+
+    now = now or datetime.now(timezone.utc)
+
+    # Parameters are collected in the order their placeholders appear
+    query = f"""
+        SELECT host_key, samesite, COUNT(*),
+               SUM({EXPIRED_SQL}),
+               SUM(expires_utc = 0),
+               SUM(is_secure != 0)
+        FROM cookies
+    """
+    params: tuple[int | str, ...] = (_datetime_to_chrome_time(now),)
+
+    where, where_params = _build_filters(domain, None, None)
+    query += where + " GROUP BY host_key, samesite"
+    params += where_params
+
+    with _open_database(cookie_path) as conn:
+        rows = conn.execute(query, params).fetchall()
+
+    domains: dict[str, DomainStats] = {}
+    for host_key, samesite, total, expired, session, secure in rows:
+        stats = domains.setdefault(host_key, DomainStats(domain=host_key))
+        stats.total += total
+        stats.expired += expired
+        stats.session += session
+        stats.secure += secure
+        policy = SAME_SITE_MAP.get(samesite, "unspecified") or "unspecified"
+        stats.same_site[policy] = stats.same_site.get(policy, 0) + total
+
+    return CookieSummary.from_domains("chrome", profile, list(domains.values()))
@@ -1,8 +1,9 @@
 # ABOUTME: Command-line interface using Typer
-# ABOUTME: Provides commands to list and extract browser cookies
+# ABOUTME: Provides commands to list, extract, summarize and merge browser cookies
 
 import json
 import sys
+from datetime import datetime, timezone
 from enum import Enum
 
 import typer
@@ -10,9 +11,13 @@ from rich.console import Console
 from rich.table import Table
 
 from . import chrome, safari
+from .merge import ConflictPolicy, available_sources, merge_profiles
+from .models import Cookie, MergeStats
 
 app = typer.Typer(help="Extract cookies from your browsers", no_args_is_help=True)
 console = Console()
+# Diagnostics go to stderr so they don't mix with piped line/JSON output
+err_console = Console(stderr=True)
 
 
 def _check_macos() -> None:
@@ -40,27 +45,31 @@ class OutputFormat(str, Enum):
     json = "json"
 
 
-@app.command()
-def cookies(
-    browser: Browser = typer.Option(
-        ..., "--browser", "-b", help="Browser to extract from"
-    ),
-    domain: str | None = typer.Option(
-        None, "--domain", "-d", help="Filter by domain (partial match)"
-    ),
-    profile: str = typer.Option(
-        "Default", "--profile", "-p", help="Browser profile name"
-    ),
-    output: OutputFormat = typer.Option(
-        OutputFormat.table, "--output", "-o", help="Output format"
-    ),
-) -> None:
-    """List cookies from a browser."""
-    if browser == Browser.chrome:
-        cookie_list = chrome.get_cookies(domain=domain, profile=profile)
-    elif browser == Browser.safari:
-        cookie_list = safari.get_cookies(domain=domain)
+class StatsFormat(str, Enum):
+    table = "table"
+    json = "json"
+
 
+def _expired_filter(exclude_expired: bool, expired_only: bool) -> bool | None:
+    """Turns the --exclude-expired/--expired-only flags into an expired filter."""
+    if exclude_expired and expired_only:
+        console.print(
+            "[red]Error: --exclude-expired and --expired-only are mutually "
+            "exclusive[/red]"
+        )
+        raise typer.Exit(1)
+
+    if expired_only:
+        return True
+    if exclude_expired:
+        return False
+    return None
+
+
+def _print_cookies(
+    cookie_list: list[Cookie], output: OutputFormat, now: datetime
+) -> None:
+    """Prints cookies in the requested output format."""
     if not cookie_list:
         if output == OutputFormat.json:
             print("[]")
@@ -68,10 +77,16 @@ def cookies(
             pass  # No output for line format when empty
         else:
             console.print("[yellow]No cookies found[/yellow]")
-        raise typer.Exit(0)
+        return
 
     if output == OutputFormat.json:
-        data = [c.model_dump(mode="json", exclude_none=True) for c in cookie_list]
+        data = [
+            {
+                **c.model_dump(mode="json", exclude_none=True, exclude={"is_expired"}),
+                "is_expired": c.is_expired_at(now),
+            }
+            for c in cookie_list
+        ]
         print(json.dumps(data, indent=2))
         return
 
@@ -126,6 +141,187 @@ def cookies(
     console.print(table)
 
 
+@app.command()
+def cookies(
+    browser: Browser = typer.Option(
+        ..., "--browser", "-b", help="Browser to extract from"
+    ),
+    domain: str | None = typer.Option(
+        None, "--domain", "-d", help="Filter by domain (partial match)"
+    ),
+    profile: str = typer.Option(
+        "Default", "--profile", "-p", help="Browser profile name"
+    ),
+    output: OutputFormat = typer.Option(
+        OutputFormat.table, "--output", "-o", help="Output format"
+    ),
+    exclude_expired: bool = typer.Option(
+        False, "--exclude-expired", help="Only show cookies that have not expired"
+    ),
+    expired_only: bool = typer.Option(
+        False, "--expired-only", help="Only show cookies that have expired"
+    ),
+) -> None:
+    """List cookies from a browser."""
+    expired = _expired_filter(exclude_expired, expired_only)
+
+    # Every expiry check in this command uses the same reference time
+    now = datetime.now(timezone.utc)
+
+    if output == OutputFormat.line:
+        # Stream line output so large Chrome profiles aren't held in memory
+        if browser == Browser.chrome:
+            stream = chrome.iter_cookies(
+                domain=domain, profile=profile, expired=expired, now=now
+            )
+        elif browser == Browser.safari:
+            stream = iter(safari.get_cookies(domain=domain, expired=expired, now=now))
+        for cookie in stream:
+            print(f"{cookie.domain} {cookie.name} {cookie.value}")
+        return
+
+    if browser == Browser.chrome:
+        cookie_list = chrome.get_cookies(
+            domain=domain, profile=profile, expired=expired, now=now
+        )
+    elif browser == Browser.safari:
+        cookie_list = safari.get_cookies(domain=domain, expired=expired, now=now)
+
+    _print_cookies(cookie_list, output, now)
+
+
+def _format_same_site(same_site: dict[str, int]) -> str:
+    """Formats a SameSite distribution as "lax=3, strict=1"."""
+    if not same_site:
+        return "-"
+    return ", ".join(f"{policy}={count}" for policy, count in sorted(same_site.items()))
+
+
+@app.command()
+def stats(
+    browser: Browser = typer.Option(
+        ..., "--browser", "-b", help="Browser to summarize"
+    ),
+    domain: str | None = typer.Option(
+        None, "--domain", "-d", help="Filter by domain (partial match)"
+    ),
+    profile: str = typer.Option(
+        "Default", "--profile", "-p", help="Browser profile name"
+    ),
+    output: StatsFormat = typer.Option(
+        StatsFormat.table, "--output", "-o", help="Output format"
+    ),
+) -> None:
+    """Summarize cookies per domain without decrypting values."""
+    if browser == Browser.chrome:
+        summary = chrome.summarize(domain=domain, profile=profile)
+    elif browser == Browser.safari:
+        summary = safari.summarize(domain=domain)
+
+    if output == StatsFormat.json:
+        print(json.dumps(summary.model_dump(mode="json"), indent=2))
+        return
+
+    if not summary.domains:
+        console.print("[yellow]No cookies found[/yellow]")
+        raise typer.Exit(0)
+
+    table = Table(
+        title=(
+            f"{summary.browser.title()} {summary.profile_name}: "
+            f"{summary.total} cookies across {len(summary.domains)} domains"
+        )
+    )
+    table.add_column("Domain", style="cyan")
+    table.add_column("Cookies", justify="right")
+    table.add_column("Expired", justify="right", style="red")
+    table.add_column("Session", justify="right", style="dim")
+    table.add_column("Secure", justify="right", style="green")
+    table.add_column("SameSite", style="yellow")
+
+    for s in summary.domains:
+        table.add_row(
+            s.domain,
+            str(s.total),
+            str(s.expired),
+            str(s.session),
+            str(s.secure),
+            _format_same_site(s.same_site),
+        )
+
+    table.add_section()
+    table.add_row(
+        "Total",
+        str(summary.total),
+        str(summary.expired),
+        str(summary.session),
+        str(summary.secure),
+        _format_same_site(summary.same_site),
+        style="bold",
+    )
+
+    console.print(table)
+
+
+def _print_merge_stats(stats: MergeStats) -> None:
+    """Prints a summary of the conflicts resolved by a merge to stderr."""
+    err_console.print(
+        f"Merged {stats.total} cookies into {stats.unique}: "
+        f"{stats.conflicts} conflicts, {stats.replaced} replaced"
+    )
+    for source, count in stats.per_source.items():
+        err_console.print(f"  {source}: {count}", style="dim")
+
+
+@app.command()
+def merge(
+    sources: list[str] | None = typer.Option(
+        None,
+        "--source",
+        "-s",
+        help=(
+            'Profile to merge, as "chrome:<profile>" or "safari"; repeat in '
+            "priority order (default: all profiles, Chrome Default first)"
+        ),
+    ),
+    policy: ConflictPolicy = typer.Option(
+        ConflictPolicy.latest_expiry,
+        "--policy",
+        help="How to pick between cookies with the same domain, name and path",
+    ),
+    domain: str | None = typer.Option(
+        None, "--domain", "-d", help="Filter by domain (partial match)"
+    ),
+    output: OutputFormat = typer.Option(
+        OutputFormat.table, "--output", "-o", help="Output format"
+    ),
+    exclude_expired: bool = typer.Option(
+        False, "--exclude-expired", help="Only merge cookies that have not expired"
+    ),
+    expired_only: bool = typer.Option(
+        False, "--expired-only", help="Only merge cookies that have expired"
+    ),
+) -> None:
+    """Merge cookies from several profiles into one jar."""
+    expired = _expired_filter(exclude_expired, expired_only)
+    now = datetime.now(timezone.utc)
+
+    try:
+        cookie_list, merge_stats = merge_profiles(
+            sources or available_sources(),
+            policy=policy,
+            domain=domain,
+            expired=expired,
+            now=now,
+        )
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1) from e
+
+    _print_cookies(cookie_list, output, now)
+    _print_merge_stats(merge_stats)
+
+
 @app.command()
 def profiles(
     browser: Browser | None = typer.Option(
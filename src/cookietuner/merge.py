@@ -0,0 +1,220 @@
+# ABOUTME: Merges cookies from several browsers and profiles into one jar
+# ABOUTME: Keeps one cookie per (domain, name, path) using a conflict policy
+
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from enum import Enum
+
+from . import chrome, safari
+from .models import Cookie, MergeStats, as_utc
+
+CookieKey = tuple[str, str, str]
+
+
+class ConflictPolicy(str, Enum):
+    """How to choose between cookies sharing the same (domain, name, path)."""
+
+    latest_expiry = "latest-expiry"
+    priority = "priority"
+
+
+def cookie_key(cookie: Cookie) -> CookieKey:
+    """Returns the identity of a cookie: its (domain, name, path)."""
+    return (cookie.domain, cookie.name, cookie.path)
+
+
+def _expiry_timestamp(cookie: Cookie, now: float) -> float:
+    """Returns the expiry as a POSIX timestamp.
+
+    Session cookies count as expiring at now, so they rank above cookies
+    that have already expired but below ones that are still valid later.
+    """
+    if cookie.expires is None:
+        return now
+    return as_utc(cookie.expires).timestamp()
+
+
+def merge_cookies(
+    sources: Iterable[tuple[str, Iterable[Cookie]]],
+    policy: ConflictPolicy = ConflictPolicy.latest_expiry,
+    priority: list[str] | None = None,
+    now: datetime | None = None,
+) -> tuple[list[Cookie], MergeStats]:
+    """
+    Merges cookie collections into a jar with one cookie per key.
+
+    Cookies are indexed by (domain, name, path) in a dict, so each cookie is
+    handled in constant time and sources are consumed as they are iterated.
+
+    Args:
+        sources: Pairs of (source name, cookies), e.g. ("chrome:Default",
+                 chrome.iter_cookies()).
+        policy: latest_expiry keeps the cookie that expires last, falling
+                back to source priority on ties; priority keeps the cookie
+                from the highest-priority source.
+        priority: Source names from highest to lowest priority. Sources not
+                  listed rank below listed ones, in the order they are given.
+                  A name listed twice keeps its first (highest) rank.
+        now: Reference time at which session cookies are considered to
+             expire under latest_expiry (default: current time).
+
+    Returns:
+        The merged cookies, in the order their keys were first seen, and
+        statistics about the merge.
+    """
+    ranks: dict[str, int] = {}
+    for rank, name in enumerate(priority or []):
+        ranks.setdefault(name, rank)
+    reference = as_utc(now or datetime.now(timezone.utc)).timestamp()
+    jar: dict[CookieKey, tuple[Cookie, str, int]] = {}
+    stats = MergeStats()
+
+    for index, (source, cookies) in enumerate(sources):
+        rank = ranks.get(source, len(ranks) + index)
+
+        for cookie in cookies:
+            stats.total += 1
+            key = cookie_key(cookie)
+            existing = jar.get(key)
+
+            if existing is None:
+                jar[key] = (cookie, source, rank)
+                continue
+
+            stats.conflicts += 1
+            current, _, current_rank = existing
+
+            if policy == ConflictPolicy.latest_expiry:
+                wins = (_expiry_timestamp(cookie, reference), -rank) > (
+                    _expiry_timestamp(current, reference),
+                    -current_rank,
+                )
+            else:
+                wins = rank < current_rank
+
+            if wins:
+                stats.replaced += 1
+                jar[key] = (cookie, source, rank)
+
+    stats.unique = len(jar)
+    for _, source, _ in jar.values():
+        stats.per_source[source] = stats.per_source.get(source, 0) + 1
+
+    return [cookie for cookie, _, _ in jar.values()], stats
+
+
+def available_sources() -> list[str]:
+    """
+    Lists every installed profile as a merge source name.
+
+    The order is stable across machines, since it is used as the merge
+    priority: Chrome's Default profile first, then the other Chrome profiles
+    by name, then Safari.
+    """
+    names = sorted(
+        (p.profile_name for p in chrome.list_profiles()),
+        key=lambda name: (name != "Default", name),
+    )
+    sources = [f"chrome:{name}" for name in names]
+    sources.extend(p.browser for p in safari.list_profiles())
+    return sources
+
+
+def _normalize_sources(sources: list[str]) -> list[str]:
+    """
+    Returns the canonical name of each source.
+
+    Chrome sources become "chrome:<profile>", with a bare "chrome" meaning
+    Default, and Safari sources become "safari".
+
+    Raises:
+        ValueError: If a source names an unknown browser or profile, or the
+                    same profile is listed more than once.
+    """
+    chrome_profiles: set[str] | None = None
+    normalized: list[str] = []
+
+    for source in sources:
+        browser, _, profile = source.partition(":")
+
+        if browser == "chrome":
+            if chrome_profiles is None:
+                chrome_profiles = {p.profile_name for p in chrome.list_profiles()}
+            profile = profile or "Default"
+            if profile not in chrome_profiles:
+                raise ValueError(f"Unknown Chrome profile in source {source!r}")
+            name = f"chrome:{profile}"
+        elif browser == "safari":
+            if profile not in ("", "Default"):
+                raise ValueError(
+                    f"Safari only has a Default profile, got source {source!r}"
+                )
+            name = "safari"
+        else:
+            raise ValueError(f"Unknown browser in source {source!r}")
+
+        if name in normalized:
+            raise ValueError(f"Source {source!r} is listed more than once")
+        normalized.append(name)
+
+    return normalized
+
+
+def merge_profiles(
+    sources: list[str],
+    policy: ConflictPolicy = ConflictPolicy.latest_expiry,
+    domain: str | None = None,
+    expired: bool | None = None,
+    now: datetime | None = None,
+) -> tuple[list[Cookie], MergeStats]:
+    """
+    Reads and merges cookies from browser profiles.
+
+    Each profile is streamed into the merge as it is read, and Chrome's
+    decryption key is fetched from the Keychain only once.
+
+    Args:
+        sources: Profiles as "chrome:<profile>" or "safari", from highest to
+                 lowest priority. A bare "chrome" means the Default profile.
+                 Each profile may be listed only once.
+        policy: Conflict policy, see merge_cookies.
+        domain: If specified, only merge cookies matching this domain.
+        expired: If True, only merge expired cookies; if False, only
+                 unexpired ones.
+        now: Reference time for the expired filter and for ranking session
+             cookies (default: current time).
+
+    Returns:
+        The merged cookies and statistics about the merge.
+
+    Raises:
+        ValueError: If a source names an unknown browser or profile, or the
+                    same profile is listed more than once.
+    """
+    sources = _normalize_sources(sources)
+
+    now = now or datetime.now(timezone.utc)
+    key: bytes | None = None
+
+    def read(source: str) -> Iterable[Cookie]:
+        nonlocal key
+        browser, _, profile = source.partition(":")
+        if browser == "chrome":
+            # Fetched when the first Chrome profile is opened, then reused
+            if key is None:
+                key = chrome.get_encryption_key()
+            return chrome.iter_cookies(
+                domain=domain,
+                profile=profile,
+                expired=expired,
+                now=now,
+                key=key,
+            )
+        return safari.get_cookies(domain=domain, expired=expired, now=now)
+
+    return merge_cookies(
+        ((source, read(source)) for source in sources),
+        policy=policy,
+        priority=sources,
+        now=now,
+    )
@@ -1,11 +1,16 @@
 # ABOUTME: Pydantic models for cookie data structures
-# ABOUTME: Defines Cookie and browser profile configuration
+# ABOUTME: Defines Cookie, browser profile configuration, statistics and merge results
 
 from datetime import datetime, timezone
 
 from pydantic import BaseModel, computed_field
 
 
+def as_utc(dt: datetime) -> datetime:
+    """Returns dt as an aware datetime, treating naive values as UTC."""
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
 class Cookie(BaseModel):
     """Represents a browser cookie with all attributes."""
 
@@ -22,15 +27,18 @@ class Cookie(BaseModel):
     @property
     def is_expired(self) -> bool:
         """Returns True if the cookie has expired."""
+        return self.is_expired_at(datetime.now(timezone.utc))
+
+    def is_expired_at(self, now: datetime) -> bool:
+        """Returns True if the cookie had expired at the given time.
+
+        Pass the same ``now`` when checking many cookies so they are all
+        evaluated against a single reference clock. Naive datetimes are
+        treated as UTC.
+        """
         if self.expires is None:
             return False  # Session cookies don't expire
-        now = datetime.now(timezone.utc)
-        expires = (
-            self.expires
-            if self.expires.tzinfo
-            else self.expires.replace(tzinfo=timezone.utc)
-        )
-        return expires < now
+        return as_utc(self.expires) < as_utc(now)
 
     def __str__(self) -> str:
         return f"{self.name}={self.value}"
@@ -42,3 +50,58 @@ class BrowserProfile(BaseModel):
     browser: str
     profile_name: str
     path: str
+
+
+class DomainStats(BaseModel):
+    """Aggregated cookie counts for a single domain."""
+
+    domain: str
+    total: int = 0
+    expired: int = 0
+    session: int = 0
+    secure: int = 0
+    same_site: dict[str, int] = {}
+
+
+class CookieSummary(BaseModel):
+    """Cookie inventory for a browser profile, without any cookie values."""
+
+    browser: str
+    profile_name: str
+    total: int = 0
+    expired: int = 0
+    session: int = 0
+    secure: int = 0
+    same_site: dict[str, int] = {}
+    domains: list[DomainStats] = []
+
+    @classmethod
+    def from_domains(
+        cls, browser: str, profile_name: str, domains: list[DomainStats]
+    ) -> "CookieSummary":
+        """Builds a summary whose totals are the sum of the per-domain counts."""
+        same_site: dict[str, int] = {}
+        for stats in domains:
+            for policy, count in stats.same_site.items():
+                same_site[policy] = same_site.get(policy, 0) + count
+
+        return cls(
+            browser=browser,
+            profile_name=profile_name,
+            total=sum(s.total for s in domains),
+            expired=sum(s.expired for s in domains),
+            session=sum(s.session for s in domains),
+            secure=sum(s.secure for s in domains),
+            same_site=same_site,
+            domains=sorted(domains, key=lambda s: (-s.total, s.domain)),
+        )
+
+
+class MergeStats(BaseModel):
+    """Statistics about a merge of several cookie collections."""
+
+    total: int = 0  # Cookies read from all sources
+    unique: int = 0  # Entries in the merged jar
+    conflicts: int = 0  # Cookies whose (domain, name, path) was already seen
+    replaced: int = 0  # Conflicts where the incoming cookie won
+    per_source: dict[str, int] = {}  # Cookies in the merged jar per source
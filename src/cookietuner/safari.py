@@ -2,10 +2,11 @@
 # ABOUTME: Parses the .binarycookies format used by Safari
 
 import struct
+from collections.abc import Iterator
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-from .models import BrowserProfile, Cookie
+from .models import BrowserProfile, Cookie, CookieSummary, DomainStats, as_utc
 
 # Sandboxed Safari (modern macOS) stores cookies here
 SAFARI_COOKIES_PATH_SANDBOXED = (
@@ -60,6 +61,19 @@ def _mac_time_to_datetime(mac_time: float) -> datetime | None:
         return None
 
 
+def _datetime_to_mac_time(dt: datetime) -> float:
+    """Converts a datetime to Mac absolute time, treating naive values as UTC."""
+    return (as_utc(dt) - MAC_EPOCH).total_seconds()
+
+
+def _is_expired(mac_time: float, now: float) -> bool:
+    """Checks a raw expiration against a reference time, both Mac absolute time.
+
+    A zero expiration marks a session cookie, which never expires.
+    """
+    return mac_time != 0 and mac_time < now
+
+
 def _read_cstring(data: bytes, offset: int) -> str:
     """Reads a null-terminated C string from data."""
     end = data.index(b"\x00", offset)
@@ -107,6 +121,7 @@ def _parse_cookie(data: bytes) -> Cookie | None:
             name=name,
             value=value,
             path=path,
+            # Converted eagerly: Cookie.expires is a validated datetime field
             expires=_mac_time_to_datetime(expiration),
             is_secure=is_secure,
             is_httponly=is_httponly,
@@ -116,29 +131,8 @@ def _parse_cookie(data: bytes) -> Cookie | None:
         return None
 
 
-def get_cookies(
-    domain: str | None = None,
-    profile: str = "Default",  # Safari only has one profile, ignored
-) -> list[Cookie]:
-    """
-    Reads cookies from Safari's binarycookies file.
-
-    Args:
-        domain: If specified, only return cookies matching this domain.
-        profile: Ignored for Safari (only one profile).
-
-    Returns:
-        List of Cookie objects.
-    """
-    cookies_path = _get_cookies_path()
-    if cookies_path is None:
-        return []
-
-    with open(cookies_path, "rb") as f:
-        data = f.read()
-
-    cookies: list[Cookie] = []
-
+def _iter_cookie_records(data: bytes) -> Iterator[bytes]:
+    """Yields the raw binary record of every cookie in a binarycookies file."""
     # File format:
     # 4 bytes: magic "cook"
     # 4 bytes: number of pages (big endian)
@@ -146,7 +140,7 @@ def get_cookies(
     # pages follow...
 
     if len(data) < 8 or data[:4] != b"cook":
-        return cookies
+        return
 
     num_pages = struct.unpack(">I", data[4:8])[0]
     page_sizes = []
@@ -179,7 +173,6 @@ def get_cookies(
             )
             page_offset += 4
 
-        # Parse each cookie
         for i, cookie_offset in enumerate(cookie_offsets):
             # Determine cookie size
             if i + 1 < len(cookie_offsets):
@@ -187,11 +180,114 @@ def get_cookies(
             else:
                 cookie_size = page_size - cookie_offset
 
-            cookie_data = page_data[cookie_offset : cookie_offset + cookie_size]
-            cookie = _parse_cookie(cookie_data)
+            yield page_data[cookie_offset : cookie_offset + cookie_size]
+
+
+def _read_cookies_file() -> bytes | None:
+    """Reads Safari's cookies file, or returns None if not found."""
+    cookies_path = _get_cookies_path()
+    if cookies_path is None:
+        return None
+
+    with open(cookies_path, "rb") as f:
+        return f.read()
+
+
+def get_cookies(
+    domain: str | None = None,
+    profile: str = "Default",  # Safari only has one profile, ignored
+    expired: bool | None = None,
+    now: datetime | None = None,
+) -> list[Cookie]:
+    """
+    Reads cookies from Safari's binarycookies file.
+
+    Args:
+        domain: If specified, only return cookies matching this domain.
+        profile: Ignored for Safari (only one profile).
+        expired: If True, only return expired cookies; if False, only
+                 return unexpired ones (including session cookies).
+        now: Reference time for the expired filter (default: current time).
 
-            if cookie:
-                if domain is None or domain.lower() in cookie.domain.lower():
-                    cookies.append(cookie)
+    Returns:
+        List of Cookie objects.
+    """
+    data = _read_cookies_file()
+    if data is None:
+        return []
+
+    cookies: list[Cookie] = []
+    reference = _datetime_to_mac_time(now or datetime.now(timezone.utc))
+
+    for cookie_data in _iter_cookie_records(data):
+        if expired is not None:
+            # Check the raw expiration before decoding the rest of the cookie
+            if len(cookie_data) < 48:
+                continue
+            expiration = struct.unpack("<d", cookie_data[40:48])[0]
+            if _is_expired(expiration, reference) != expired:
+                continue
+
+        cookie = _parse_cookie(cookie_data)
+
+        if cookie:
+            if domain is None or domain.lower() in cookie.domain.lower():
+                cookies.append(cookie)
 
     return cookies
+
+
+def summarize(
+    domain: str | None = None,
+    profile: str = "Default",  # Safari only has one profile, ignored
+    now: datetime | None = None,
+) -> CookieSummary:
+    """
+    Summarizes Safari's binarycookies file.
+
+    Only the header fields and the domain of each cookie are read; names,
+    paths and values are never decoded.
+
+    Args:
+        domain: If specified, only count cookies matching this domain.
+        profile: Ignored for Safari (only one profile).
+        now: Reference time for counting expired cookies (default: current
+             time).
+
+    Returns:
+        CookieSummary with per-domain counts.
+    """
+    data = _read_cookies_file()
+    if data is None:
+        return CookieSummary(browser="safari", profile_name="Default")
+
+    reference = _datetime_to_mac_time(now or datetime.now(timezone.utc))
+    domains: dict[str, DomainStats] = {}
+
+    for cookie_data in _iter_cookie_records(data):
+        if len(cookie_data) < 48:
+            continue
+
+        try:
+            flags = struct.unpack("<I", cookie_data[8:12])[0]
+            domain_offset = struct.unpack("<I", cookie_data[16:20])[0]
+            expiration = struct.unpack("<d", cookie_data[40:48])[0]
+            cookie_domain = _read_cstring(cookie_data, domain_offset)
+        except Exception:
+            continue
+
+        if domain is not None and domain.lower() not in cookie_domain.lower():
+            continue
+
+        stats = domains.setdefault(cookie_domain, DomainStats(domain=cookie_domain))
+        stats.total += 1
+        if expiration == 0:
+            stats.session += 1
+        elif _is_expired(expiration, reference):
+            stats.expired += 1
+        if flags & 0x1:
+            stats.secure += 1
+        policy = SAME_SITE_MAP.get((flags >> 3) & 0x7) or "unspecified"
+        stats.same_site[policy] = stats.same_site.get(policy, 0) + 1
+
+    return CookieSummary.from_domains("safari", "Default", list(domains.values()))
@@ -0,0 +1,37 @@
+# ABOUTME: Shared pytest fixtures for the cookietuner tests
+# ABOUTME: Builds fake Chrome cookie databases on disk
+
+import sqlite3
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+
+def _create_chrome_database(path: Path, rows: list[tuple]) -> None:
+    """Creates a Chrome cookie database holding the given cookie rows."""
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE meta (key TEXT, value TEXT)")
+    conn.execute("INSERT INTO meta VALUES ('version', '23')")
+    conn.execute(
+        """
+        CREATE TABLE cookies (
+            host_key TEXT, name TEXT, encrypted_value BLOB, path TEXT,
+            expires_utc INTEGER, is_secure INTEGER, is_httponly INTEGER,
+            samesite INTEGER
+        )
+        """
+    )
+    conn.executemany("INSERT INTO cookies VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture
+def create_chrome_database() -> Callable[[Path, list[tuple]], None]:
+    """Returns a function that writes a Chrome cookie database to a path.
+
+    Rows are (host_key, name, encrypted_value, path, expires_utc, is_secure,
+    is_httponly, samesite) tuples.
+    """
+    return _create_chrome_database
@@ -1,12 +1,51 @@
 # ABOUTME: Tests for Chrome cookie extraction
 # ABOUTME: Verifies we can read and decrypt Chrome cookies on macOS
 
-from datetime import datetime
+import sqlite3
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 
+import pytest
+
+from cookietuner import chrome
 from cookietuner.chrome import get_cookies, list_profiles
 from cookietuner.models import Cookie
 
 
+def _to_chrome_time(dt: datetime) -> int:
+    return int((dt - chrome.CHROME_EPOCH).total_seconds() * 1_000_000)
+
+
+@pytest.fixture
+def chrome_profile(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    create_chrome_database: Callable[[Path, list[tuple]], None],
+) -> Path:
+    """Creates a fake Chrome profile with a small cookie database."""
+    monkeypatch.setattr(chrome, "CHROME_BASE_PATH", tmp_path)
+    profile_dir = tmp_path / "Default"
+    profile_dir.mkdir()
+
+    now = datetime.now(timezone.utc)
+    future = _to_chrome_time(now + timedelta(days=30))
+    past = _to_chrome_time(now - timedelta(days=30))
+
+    create_chrome_database(
+        profile_dir / "Cookies",
+        [
+            (".example.com", "a", b"1", "/", future, 1, 1, 1),
+            (".example.com", "b", b"2", "/", past, 1, 0, 2),
+            (".example.com", "c", b"3", "/", 0, 0, 0, -1),
+            (".other.org", "d", b"4", "/", future, 0, 0, 1),
+        ],
+    )
+    return profile_dir
+
+
 def test_get_cookies_returns_list_of_cookies() -> None:
     """get_cookies should return a list of Cookie objects."""
     cookies = get_cookies()
@@ -66,3 +105,233 @@ def test_list_profiles_returns_browser_profiles() -> None:
     if profiles:
         default_profiles = [p for p in profiles if p.profile_name == "Default"]
         assert len(default_profiles) <= 1  # At most one Default
+
+
+def test_summarize_counts_per_domain_without_keychain(
+    chrome_profile: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """summarize should aggregate counts without fetching the encryption key."""
+
+    def fail() -> bytes:
+        raise AssertionError("summarize must not touch the Keychain")
+
+    monkeypatch.setattr(chrome, "get_encryption_key", fail)
+
+    summary = chrome.summarize()
+    assert summary.total == 4
+    assert summary.expired == 1
+    assert summary.session == 1
+    assert summary.secure == 2
+    assert summary.same_site == {"lax": 2, "strict": 1, "unspecified": 1}
+
+    example = summary.domains[0]
+    assert example.domain == ".example.com"
+    assert example.total == 3
+    assert example.same_site == {"lax": 1, "strict": 1, "unspecified": 1}
+
+
+def test_summarize_filters_by_domain(chrome_profile: Path) -> None:
+    """summarize should only count domains matching the filter."""
+    summary = chrome.summarize(domain="other")
+    assert [s.domain for s in summary.domains] == [".other.org"]
+    assert summary.total == 1
+
+
+def test_summarize_missing_profile_is_empty(chrome_profile: Path) -> None:
+    """summarize should return an empty summary for unknown profiles."""
+    summary = chrome.summarize(profile="Profile 9")
+    assert summary.total == 0
+    assert summary.domains == []
+
+
+def test_iter_cookies_streams_all_rows(
+    chrome_profile: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """iter_cookies should yield every cookie regardless of batch size."""
+    monkeypatch.setattr(chrome, "get_encryption_key", lambda: b"k" * 16)
+
+    cookies = list(chrome.iter_cookies(batch_size=1))
+    assert [(c.name, c.value) for c in cookies] == [
+        ("a", "1"),
+        ("b", "2"),
+        ("c", "3"),
+        ("d", "4"),
+    ]
+    assert get_cookies(domain="other", batch_size=3) == cookies[3:]
+
+
+def test_iter_cookies_rejects_invalid_batch_size(chrome_profile: Path) -> None:
+    """iter_cookies should refuse batch sizes below one."""
+    with pytest.raises(ValueError):
+        next(chrome.iter_cookies(batch_size=0))
+
+
+def test_batch_rows_fits_largest_row_in_memory_cap() -> None:
+    """Batches should shrink so that even the largest rows fit the cap."""
+    assert chrome._batch_rows(20, 500, 100) == 5
+    assert chrome._batch_rows(20, 1_000_000, 100) == 20
+    assert chrome._batch_rows(20, 50, 100) == 1
+
+
+class _RecordingCursor(sqlite3.Cursor):
+    """Cursor that records every fetchmany() batch and forbids iteration."""
+
+    batches: list[list[tuple]] = []
+
+    def fetchmany(self, size: int = 1) -> list:
+        rows = super().fetchmany(size)
+        if rows:
+            _RecordingCursor.batches.append(rows)
+        return rows
+
+    def __next__(self) -> tuple:
+        raise AssertionError("rows must be fetched in chunks, not one by one")
+
+
+class _RecordingConnection(sqlite3.Connection):
+    def cursor(self, factory: type = _RecordingCursor) -> sqlite3.Cursor:
+        return super().cursor(factory)
+
+
+def test_iter_cookies_fetches_bounded_chunks(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    create_chrome_database: Callable[[Path, list[tuple]], None],
+) -> None:
+    """iter_cookies should fetch rows in chunks that fit max_batch_bytes."""
+    rows = [(f".site{i:02}.com", "n", b"v" * 1000, "/", 0, 0, 0, -1) for i in range(50)]
+    db_path = tmp_path / "Cookies"
+    create_chrome_database(db_path, rows)
+
+    @contextmanager
+    def open_database(cookie_path: Path) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(db_path, factory=_RecordingConnection)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    monkeypatch.setattr(chrome, "_open_database", open_database)
+    monkeypatch.setattr(chrome, "_get_cookie_path", lambda profile: db_path)
+    monkeypatch.setattr(chrome, "get_encryption_key", lambda: b"k" * 16)
+    monkeypatch.setattr(_RecordingCursor, "batches", [])
+
+    cookies = list(chrome.iter_cookies(batch_size=20, max_batch_bytes=5000))
+
+    assert len(cookies) == 50
+    batches = _RecordingCursor.batches
+    assert sum(len(batch) for batch in batches) == 50
+    for batch in batches:
+        batch_bytes = sum(
+            len(host.encode()) + len(name.encode()) + len(value) + len(path.encode())
+            for host, name, value, path, *_ in batch
+        )
+        assert batch_bytes <= 5000
+
+
+def _peak_memory_streaming(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    create_chrome_database: Callable[[Path, list[tuple]], None],
+    num_rows: int,
+) -> int:
+    """Returns the peak traced memory while streaming num_rows cookies."""
+    profile_dir = tmp_path / f"rows-{num_rows}"
+    profile_dir.mkdir()
+    create_chrome_database(
+        profile_dir / "Cookies",
+        [
+            (f".site{i}.com", "n", b"v" * 4096, "/", 0, 0, 0, -1)
+            for i in range(num_rows)
+        ],
+    )
+    monkeypatch.setattr(chrome, "CHROME_BASE_PATH", tmp_path)
+    monkeypatch.setattr(chrome, "get_encryption_key", lambda: b"k" * 16)
+
+    tracemalloc.start()
+    try:
+        count = 0
+        for _ in chrome.iter_cookies(profile=profile_dir.name, batch_size=100):
+            count += 1
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert count == num_rows
+    return peak
+
+
+def test_iter_cookies_peak_memory_is_flat(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    create_chrome_database: Callable[[Path, list[tuple]], None],
+) -> None:
+    """Peak memory while streaming should not scale with the row count."""
+    args = (tmp_path, monkeypatch, create_chrome_database)
+    _peak_memory_streaming(*args, 10)  # warm up caches
+    small = _peak_memory_streaming(*args, 500)
+    large = _peak_memory_streaming(*args, 5000)
+
+    # Reported with `pytest -s`; tracemalloc stands in for process RSS
+    report = f"peak memory: {small:,} bytes for 500 rows, {large:,} for 5000"
+    print(report)
+
+    # Holding all 5000 rows would need more than 20 MB
+    assert large < 2 * small, report
+
+
+def test_is_expired_at_uses_reference_time() -> None:
+    """is_expired_at should compare against the given time, not the clock."""
+    cookie = Cookie(
+        domain=".example.com",
+        name="test",
+        value="123",
+        path="/",
+        expires=datetime(2025, 6, 1),
+    )
+    assert cookie.is_expired_at(datetime(2025, 7, 1, tzinfo=timezone.utc))
+    assert not cookie.is_expired_at(datetime(2025, 5, 1, tzinfo=timezone.utc))
+
+
+@pytest.mark.parametrize(
+    ("expired", "names"),
+    [(None, ["a", "b", "c", "d"]), (True, ["b"]), (False, ["a", "c", "d"])],
+)
+def test_get_cookies_filters_expired_in_sql(
+    chrome_profile: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    expired: bool | None,
+    names: list[str],
+) -> None:
+    """get_cookies should filter on expiry, keeping session cookies unexpired."""
+    monkeypatch.setattr(chrome, "get_encryption_key", lambda: b"k" * 16)
+
+    cookies = get_cookies(expired=expired)
+    assert [c.name for c in cookies] == names
+
+
+def test_get_cookies_expired_filter_uses_given_now(
+    chrome_profile: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The expired filter should be evaluated against the supplied time."""
+    monkeypatch.setattr(chrome, "get_encryption_key", lambda: b"k" * 16)
+
+    later = datetime.now(timezone.utc) + timedelta(days=365)
+    cookies = get_cookies(expired=True, now=later)
+    assert [c.name for c in cookies] == ["a", "b", "d"]
+
+
+def test_naive_reference_time_is_treated_as_utc(
+    chrome_profile: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A naive now= should be accepted and interpreted as UTC."""
+    monkeypatch.setattr(chrome, "get_encryption_key", lambda: b"k" * 16)
+
+    naive_now = datetime.now(timezone.utc).replace(tzinfo=None)
+    assert [c.name for c in get_cookies(expired=True, now=naive_now)] == ["b"]
+    assert chrome.summarize(now=naive_now).expired == 1
+
+    cookie = Cookie(
+        domain="a", name="b", value="c", path="/", expires=datetime(2025, 6, 1)
+    )
+    assert cookie.is_expired_at(datetime(2025, 7, 1))
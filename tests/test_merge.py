@@ -0,0 +1,219 @@
+# ABOUTME: Tests for merging cookies across browsers and profiles
+# ABOUTME: Verifies deduplication, conflict policies and merge statistics
+
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from cookietuner import chrome, safari
+from cookietuner.merge import (
+    ConflictPolicy,
+    available_sources,
+    merge_cookies,
+    merge_profiles,
+)
+from cookietuner.models import Cookie
+
+
+def _cookie(name: str, value: str, expires: datetime | None = None) -> Cookie:
+    return Cookie(
+        domain=".example.com", name=name, value=value, path="/", expires=expires
+    )
+
+
+EARLY = datetime(2030, 1, 1, tzinfo=timezone.utc)
+LATE = datetime(2031, 1, 1, tzinfo=timezone.utc)
+
+
+def test_merge_keeps_one_cookie_per_key() -> None:
+    """Cookies sharing (domain, name, path) should be merged into one."""
+    cookies, stats = merge_cookies(
+        [
+            ("a", [_cookie("x", "1", EARLY), _cookie("y", "2")]),
+            ("b", [_cookie("x", "3", LATE), _cookie("z", "4")]),
+        ]
+    )
+    assert [(c.name, c.value) for c in cookies] == [("x", "3"), ("y", "2"), ("z", "4")]
+    assert stats.total == 4
+    assert stats.unique == 3
+    assert stats.conflicts == 1
+    assert stats.replaced == 1
+    assert stats.per_source == {"a": 1, "b": 2}
+
+
+def test_latest_expiry_prefers_persistent_over_session() -> None:
+    """A persistent cookie should win over a session cookie."""
+    cookies, _ = merge_cookies(
+        [("a", [_cookie("x", "persistent", EARLY)]), ("b", [_cookie("x", "session")])]
+    )
+    assert cookies[0].value == "persistent"
+
+
+def test_latest_expiry_breaks_ties_by_priority() -> None:
+    """Cookies with equal expiry should be resolved by source priority."""
+    sources = [
+        ("a", [_cookie("x", "from-a", LATE)]),
+        ("b", [_cookie("x", "from-b", LATE)]),
+    ]
+
+    cookies, stats = merge_cookies(sources)
+    assert cookies[0].value == "from-a"
+    assert stats.replaced == 0
+
+    cookies, stats = merge_cookies(sources, priority=["b", "a"])
+    assert cookies[0].value == "from-b"
+    assert stats.replaced == 1
+
+
+def test_priority_policy_ignores_expiry() -> None:
+    """The priority policy should keep the cookie from the preferred source."""
+    cookies, stats = merge_cookies(
+        [("a", [_cookie("x", "from-a", LATE)]), ("b", [_cookie("x", "from-b", EARLY)])],
+        policy=ConflictPolicy.priority,
+        priority=["b"],
+    )
+    assert cookies[0].value == "from-b"
+    assert stats.conflicts == 1
+
+
+def test_merge_consumes_sources_lazily() -> None:
+    """Sources should be read one cookie at a time rather than up front."""
+
+    def stream(n: int):
+        for i in range(n):
+            yield _cookie(f"c{i % 10}", str(i))
+
+    cookies, stats = merge_cookies([("a", stream(1000))])
+    assert stats.total == 1000
+    assert stats.unique == len(cookies) == 10
+
+
+def test_merge_profiles_rejects_unknown_browser() -> None:
+    """merge_profiles should refuse sources for unsupported browsers."""
+    with pytest.raises(ValueError):
+        merge_profiles(["firefox:Default"])
+
+
+def test_latest_expiry_prefers_session_over_expired() -> None:
+    """A live session cookie should win over one that has already expired."""
+    cookies, stats = merge_cookies(
+        [
+            ("a", [_cookie("x", "session")]),
+            ("b", [_cookie("x", "dead", datetime(2019, 1, 1, tzinfo=timezone.utc))]),
+        ],
+        now=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+    assert cookies[0].value == "session"
+    assert stats.replaced == 0
+
+
+@pytest.fixture
+def chrome_profiles(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    create_chrome_database: Callable[[Path, list[tuple]], None],
+) -> list[str]:
+    """Creates fake Chrome profiles, each holding one unencrypted cookie."""
+    monkeypatch.setattr(chrome, "CHROME_BASE_PATH", tmp_path)
+    monkeypatch.setattr(safari, "SAFARI_COOKIES_PATH_SANDBOXED", tmp_path / "none")
+    monkeypatch.setattr(safari, "SAFARI_COOKIES_PATH_LEGACY", tmp_path / "none")
+
+    names = ["Profile 2", "Default", "Profile 1"]
+    for name in names:
+        (tmp_path / name).mkdir()
+        create_chrome_database(
+            tmp_path / name / "Cookies",
+            [(".example.com", "x", name.encode(), "/", 0, 0, 0, -1)],
+        )
+    return names
+
+
+def test_available_sources_have_stable_order(chrome_profiles: list[str]) -> None:
+    """Default should come first, then other Chrome profiles by name."""
+    assert available_sources() == [
+        "chrome:Default",
+        "chrome:Profile 1",
+        "chrome:Profile 2",
+    ]
+
+
+def test_merge_profiles_fetches_key_once(
+    chrome_profiles: list[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The Keychain should be queried once per merge, not once per profile."""
+    calls = []
+
+    def fake_key() -> bytes:
+        calls.append(1)
+        return b"k" * 16
+
+    monkeypatch.setattr(chrome, "get_encryption_key", fake_key)
+
+    cookies, stats = merge_profiles(available_sources(), policy=ConflictPolicy.priority)
+    assert [c.value for c in cookies] == ["Default"]
+    assert stats.total == 3
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize(
+    "source", ["chrome:Profil 1", "safari:anything", "firefox:Default"]
+)
+def test_merge_profiles_rejects_unknown_sources(
+    chrome_profiles: list[str], source: str
+) -> None:
+    """merge_profiles should refuse sources that don't name a real profile."""
+    with pytest.raises(ValueError):
+        merge_profiles(["chrome:Default", source])
+
+
+@pytest.mark.parametrize(
+    "sources",
+    [
+        ["chrome", "chrome:Default"],
+        ["chrome:Profile 1", "chrome:Profile 1"],
+        ["safari", "safari:Default"],
+    ],
+)
+def test_merge_profiles_rejects_duplicate_sources(
+    chrome_profiles: list[str], sources: list[str]
+) -> None:
+    """The same profile listed twice should be rejected, aliases included."""
+    with pytest.raises(ValueError, match="more than once"):
+        merge_profiles(sources)
+
+
+def test_merge_profiles_normalizes_source_names(
+    chrome_profiles: list[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A bare "chrome" should be reported as chrome:Default."""
+    monkeypatch.setattr(chrome, "get_encryption_key", lambda: b"k" * 16)
+
+    _, stats = merge_profiles(["chrome", "chrome:Profile 1"])
+    assert stats.conflicts == 1
+    assert stats.per_source == {"chrome:Default": 1}
+
+
+def test_duplicate_priority_keeps_first_rank() -> None:
+    """A name listed twice in priority should keep its highest rank."""
+    cookies, _ = merge_cookies(
+        [("a", [_cookie("x", "from-a")]), ("b", [_cookie("x", "from-b")])],
+        policy=ConflictPolicy.priority,
+        priority=["b", "a", "b"],
+    )
+    assert cookies[0].value == "from-b"
+
+
+def test_merge_profiles_without_chrome_skips_keychain(
+    chrome_profiles: list[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Merging only Safari should never query the Keychain."""
+
+    def fail() -> bytes:
+        raise AssertionError("Safari-only merges must not touch the Keychain")
+
+    monkeypatch.setattr(chrome, "get_encryption_key", fail)
+
+    cookies, _ = merge_profiles(["safari"])
+    assert cookies == []
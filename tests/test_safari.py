@@ -1,9 +1,71 @@
 # ABOUTME: Tests for Safari cookie extraction
 # ABOUTME: Verifies Safari binarycookies parsing
 
+import struct
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from cookietuner import safari
 from cookietuner.safari import get_cookies, list_profiles
 
 
+def _encode_cookie(
+    domain: str, name: str, path: str, value: str, flags: int, expiration: float
+) -> bytes:
+    """Encodes a single cookie record in the binarycookies layout."""
+    strings = b""
+    offsets = []
+    for field in (domain, name, path, value):
+        offsets.append(56 + len(strings))
+        strings += field.encode() + b"\x00"
+
+    header = struct.pack("<IIII", 56 + len(strings), 0, flags, 0)
+    header += struct.pack("<IIII", *offsets)
+    header += b"\x00" * 8
+    header += struct.pack("<dd", expiration, 0.0)
+    return header + strings
+
+
+def _encode_file(records: list[bytes]) -> bytes:
+    """Encodes a binarycookies file with all records in a single page."""
+    page_header_size = 8 + 4 * len(records) + 4
+    offsets = []
+    body = b""
+    for record in records:
+        offsets.append(page_header_size + len(body))
+        body += record
+
+    page = struct.pack("<II", 0x100, len(records))
+    page += struct.pack(f"<{len(records)}I", *offsets)
+    page += b"\x00" * 4
+    page += body
+
+    return b"cook" + struct.pack(">I", 1) + struct.pack(">I", len(page)) + page
+
+
+@pytest.fixture
+def safari_cookies(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Writes a fake Safari cookies file and points the module at it."""
+    now = (datetime.now(timezone.utc) - safari.MAC_EPOCH).total_seconds()
+    future = now + timedelta(days=30).total_seconds()
+    past = now - timedelta(days=30).total_seconds()
+
+    records = [
+        _encode_cookie(".example.com", "a", "/", "1", 0x1 | (5 << 3), future),
+        _encode_cookie(".example.com", "b", "/", "2", 0x1 | (7 << 3), past),
+        _encode_cookie(".example.com", "c", "/", "3", 0, 0.0),
+        _encode_cookie(".other.org", "d", "/", "4", 5 << 3, future),
+    ]
+    cookies_path = tmp_path / "Cookies.binarycookies"
+    cookies_path.write_bytes(_encode_file(records))
+
+    monkeypatch.setattr(safari, "SAFARI_COOKIES_PATH_SANDBOXED", cookies_path)
+    monkeypatch.setattr(safari, "SAFARI_COOKIES_PATH_LEGACY", tmp_path / "missing")
+    return cookies_path
+
+
 def test_list_profiles_returns_safari_profile() -> None:
     """list_profiles should return Safari profile if Safari is installed."""
     profiles = list_profiles()
@@ -26,3 +88,52 @@ def test_get_cookies_filters_by_domain() -> None:
     cookies = get_cookies(domain="apple.com")
     for cookie in cookies:
         assert "apple" in cookie.domain.lower()
+
+
+def test_get_cookies_parses_binarycookies(safari_cookies: Path) -> None:
+    """get_cookies should decode every cookie in the file."""
+    cookies = get_cookies()
+    assert [(c.domain, c.name, c.value) for c in cookies] == [
+        (".example.com", "a", "1"),
+        (".example.com", "b", "2"),
+        (".example.com", "c", "3"),
+        (".other.org", "d", "4"),
+    ]
+    assert cookies[0].same_site == "lax"
+    assert cookies[2].expires is None
+
+
+def test_summarize_counts_per_domain(safari_cookies: Path) -> None:
+    """summarize should aggregate counts from the header and domain fields."""
+    summary = safari.summarize()
+    assert summary.total == 4
+    assert summary.expired == 1
+    assert summary.session == 1
+    assert summary.secure == 2
+    assert summary.same_site == {"lax": 2, "strict": 1, "unspecified": 1}
+    assert [(s.domain, s.total) for s in summary.domains] == [
+        (".example.com", 3),
+        (".other.org", 1),
+    ]
+
+
+def test_summarize_filters_by_domain(safari_cookies: Path) -> None:
+    """summarize should only count domains matching the filter."""
+    summary = safari.summarize(domain="OTHER")
+    assert [s.domain for s in summary.domains] == [".other.org"]
+
+
+def test_get_cookies_filters_expired(safari_cookies: Path) -> None:
+    """get_cookies should filter on the raw expiration before decoding."""
+    assert [c.name for c in get_cookies(expired=True)] == ["b"]
+    assert [c.name for c in get_cookies(expired=False)] == ["a", "c", "d"]
+
+    later = datetime.now(timezone.utc) + timedelta(days=365)
+    assert [c.name for c in get_cookies(expired=True, now=later)] == ["a", "b", "d"]
+
+
+def test_naive_reference_time_is_treated_as_utc(safari_cookies: Path) -> None:
+    """A naive now= should be accepted and interpreted as UTC."""
+    naive_now = datetime.now(timezone.utc).replace(tzinfo=None)
+    assert [c.name for c in get_cookies(expired=True, now=naive_now)] == ["b"]
+    assert safari.summarize(now=naive_now).expired == 1